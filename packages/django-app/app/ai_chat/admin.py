@@ -44,6 +44,7 @@ class AIModelAdmin(admin.ModelAdmin):
     search_fields = ["name", "display_name", "description"]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
     raw_id_fields = ["provider"]
+    list_select_related = ["provider"]
 
     fieldsets = (
         (None, {"fields": ("name", "provider", "display_name", "is_active")}),
@@ -95,6 +96,7 @@ class ChatSessionAdmin(admin.ModelAdmin):
     search_fields = ["title", "user__email", "user__first_name", "user__last_name"]
     readonly_fields = ["id", "uuid", "created_at", "modified_at", "message_count"]
     raw_id_fields = ["user"]
+    list_select_related = ["user"]
     inlines = [ChatMessageInline]
 
     fieldsets = (
@@ -138,6 +140,7 @@ class ChatMessageAdmin(admin.ModelAdmin):
     search_fields = ["content", "session__title", "session__user__email"]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
     raw_id_fields = ["session"]
+    list_select_related = ["session"]
 
     fieldsets = (
         (None, {"fields": ("session", "role", "content")}),
@@ -182,6 +185,7 @@ class UserAISettingsAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
     raw_id_fields = ["user", "preferred_model"]
+    list_select_related = ["user", "preferred_model__provider"]
 
     fieldsets = (
         (None, {"fields": ("user", "preferred_model")}),
@@ -215,6 +219,7 @@ class UserProviderConfigAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ["id", "uuid", "created_at", "modified_at"]
     raw_id_fields = ["user", "provider"]
+    list_select_related = ["user", "provider"]
 
     fieldsets = (
         (None, {"fields": ("user", "provider", "is_enabled")}),
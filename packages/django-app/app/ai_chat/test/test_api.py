@@ -29,63 +29,61 @@ class AIChatAPITestCase(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.user = UserFactory(email="test@example.com")
-        cls.user.set_password("testpass123")
-        cls.user.save()
+        cls.user = UserFactory(email="test@example.com", password="testpass123")
 
         # Create AI providers
         cls.openai_provider = OpenAIProviderFactory()
         cls.anthropic_provider = AnthropicProviderFactory()
 
-    def setUp(self):
-        self.client = APIClient()
-        self.token = Token.objects.create(user=self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
-
         # Create AIModel entries for testing
-        self.gpt4_model = AIModel.objects.create(
+        cls.gpt4_model = AIModel.objects.create(
             name="gpt-4",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-4",
             description="Test GPT-4 model",
             is_active=True,
         )
-        self.gpt35_model = AIModel.objects.create(
+        cls.gpt35_model = AIModel.objects.create(
             name="gpt-3.5-turbo",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-3.5 Turbo",
             description="Test GPT-3.5 model",
             is_active=True,
         )
 
         # Create Anthropic models for testing
-        self.claude_sonnet_model = AIModel.objects.create(
+        cls.claude_sonnet_model = AIModel.objects.create(
             name="claude-3-sonnet",
-            provider=self.anthropic_provider,
+            provider=cls.anthropic_provider,
             display_name="Claude 3 Sonnet",
             description="Test Claude 3 Sonnet model",
             is_active=True,
         )
-        self.claude_haiku_model = AIModel.objects.create(
+        cls.claude_haiku_model = AIModel.objects.create(
             name="claude-3-haiku",
-            provider=self.anthropic_provider,
+            provider=cls.anthropic_provider,
             display_name="Claude 3 Haiku",
             description="Test Claude 3 Haiku model",
             is_active=True,
         )
 
         # Create user AI settings with preferred model
-        self.user_settings = UserAISettingsFactory(
-            user=self.user, preferred_model=self.gpt4_model
+        cls.user_settings = UserAISettingsFactory(
+            user=cls.user, preferred_model=cls.gpt4_model
         )
 
         # Create provider config with API key
-        self.provider_config = UserProviderConfigFactory(
-            user=self.user,
-            provider=self.openai_provider,
+        cls.provider_config = UserProviderConfigFactory(
+            user=cls.user,
+            provider=cls.openai_provider,
             api_key="test-api-key-12345",
-            enabled_models=[self.gpt4_model, self.gpt35_model],
+            enabled_models=[cls.gpt4_model, cls.gpt35_model],
         )
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
 
     @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
     def test_send_message_success(self, mock_create_service):
@@ -28,34 +28,33 @@ class SendMessageCommandTestCase(TestCase):
         cls.user = UserFactory(email="test@example.com")
         cls.openai_provider = OpenAIProviderFactory()
 
-    def setUp(self):
         # Create AIModel entries for testing
-        self.gpt4_model = AIModel.objects.create(
+        cls.gpt4_model = AIModel.objects.create(
             name="gpt-4",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-4",
             description="Test GPT-4 model",
             is_active=True,
         )
-        self.gpt35_model = AIModel.objects.create(
+        cls.gpt35_model = AIModel.objects.create(
             name="gpt-3.5-turbo",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-3.5 Turbo",
             description="Test GPT-3.5 model",
             is_active=True,
         )
 
         # Create user AI settings with preferred model
-        self.user_settings = UserAISettingsFactory(
-            user=self.user, preferred_model=self.gpt4_model
+        cls.user_settings = UserAISettingsFactory(
+            user=cls.user, preferred_model=cls.gpt4_model
         )
 
         # Create provider config with API key
-        self.provider_config = UserProviderConfigFactory(
-            user=self.user,
-            provider=self.openai_provider,
+        cls.provider_config = UserProviderConfigFactory(
+            user=cls.user,
+            provider=cls.openai_provider,
             api_key="test-api-key-12345",
-            enabled_models=[self.gpt4_model, self.gpt35_model],
+            enabled_models=[cls.gpt4_model, cls.gpt35_model],
         )
 
     def _create_form(
@@ -1,6 +1,6 @@
 from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from ai_chat.models import AIModel
 from ai_chat.repositories.user_settings_repository import UserSettingsRepository
@@ -15,7 +15,7 @@ from ai_chat.test.helpers import (
 from core.test.helpers import UserFactory
 
 
-class AIServiceFactoryTestCase(TestCase):
+class AIServiceFactoryTestCase(SimpleTestCase):
     """Test AI service factory functionality"""
 
     def test_get_supported_providers(self):
@@ -98,12 +98,10 @@ class UserSettingsRepositoryTestCase(TestCase):
         cls.anthropic_provider = AnthropicProviderFactory()
         cls.repo = UserSettingsRepository()
 
-    def setUp(self):
         # Create AIModel for testing
-
-        self.gpt4_model = AIModel.objects.create(
+        cls.gpt4_model = AIModel.objects.create(
             name="gpt-4",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-4",
             description="Test GPT-4 model",
             is_active=True,
@@ -189,7 +187,7 @@ class UserSettingsRepositoryTestCase(TestCase):
         self.assertNotEqual(result_other, test_settings)
 
 
-class BaseAIServiceTestCase(TestCase):
+class BaseAIServiceTestCase(SimpleTestCase):
     """Test base AI service functionality"""
 
     def test_ai_service_error_creation(self):
@@ -233,22 +231,21 @@ class ServiceIntegrationTestCase(TestCase):
         cls.openai_provider = OpenAIProviderFactory()
         cls.repo = UserSettingsRepository()
 
-    def setUp(self):
         # Create AIModel for testing
-        self.gpt4_model = AIModel.objects.create(
+        cls.gpt4_model = AIModel.objects.create(
             name="gpt-4",
-            provider=self.openai_provider,
+            provider=cls.openai_provider,
             display_name="GPT-4",
             description="Test GPT-4 model",
             is_active=True,
         )
 
-        self.user_settings = UserAISettingsFactory(
-            user=self.user, preferred_model=self.gpt4_model
+        cls.user_settings = UserAISettingsFactory(
+            user=cls.user, preferred_model=cls.gpt4_model
         )
 
-        self.provider_config = UserProviderConfigFactory(
-            user=self.user, provider=self.openai_provider, api_key="test-api-key-12345"
+        cls.provider_config = UserProviderConfigFactory(
+            user=cls.user, provider=cls.openai_provider, api_key="test-api-key-12345"
         )
 
     @patch("ai_chat.services.ai_service_factory.AIServiceFactory.create_service")
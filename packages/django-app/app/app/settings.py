@@ -68,6 +68,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "common.middleware.APIErrorLoggingMiddleware",
+    "common.middleware.RequestBodySizeLimitMiddleware",
 ]
 
 ROOT_URLCONF = "app.urls"
@@ -4,3 +4,20 @@ from .settings import *
 Adds `common` app to installed apps so that test models are only created for tests.
 """
 INSTALLED_APPS += ["common"]
+
+"""
+Use a cheap hasher so `set_password` / `authenticate` don't pay production
+PBKDF2 iterations in every test. Never use this outside of tests.
+"""
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+"""
+Build the test database straight from the current models instead of replaying
+every migration. `makemigrations --check` still guards against model drift.
+"""
+DATABASES["default"]["TEST"] = {"MIGRATE": False}
+
+"""
+Tests never need durable commits, so don't wait for WAL flushes on commit.
+"""
+DATABASES["default"]["OPTIONS"] = {"options": "-c synchronous_commit=off"}
@@ -1,6 +1,9 @@
 import json
 import logging
 
+from django.conf import settings
+from django.http import JsonResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,3 +43,31 @@ class APIErrorLoggingMiddleware:
             )
         except Exception as e:
             logger.error(f"Error logging API error: {e}")
+
+
+class RequestBodySizeLimitMiddleware:
+    """Middleware to reject oversized non-upload request bodies with a 413"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # DRF streams the body straight into its parsers, which skips Django's
+        # DATA_UPLOAD_MAX_MEMORY_SIZE check, so enforce it from Content-Length
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if max_size is not None and not request.content_type.startswith("multipart/"):
+            try:
+                content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                content_length = 0
+
+            if content_length > max_size:
+                return JsonResponse(
+                    {
+                        "success": False,
+                        "errors": {"non_field_errors": ["Request body too large"]},
+                    },
+                    status=413,
+                )
+
+        return self.get_response(request)
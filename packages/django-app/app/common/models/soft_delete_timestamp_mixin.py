@@ -29,12 +29,19 @@ class SoftDeleteTimestampMixin(models.Model):
         else:
             self.deleted_at = timezone.now()
             self.is_active = False
-            super().save()
+            super().save(update_fields=self._soft_delete_update_fields())
 
     def undelete(self, *args, **kwargs):
         self.is_active = True
         self.deleted_at = None
-        super().save()
+        super().save(update_fields=self._soft_delete_update_fields())
+
+    def _soft_delete_update_fields(self):
+        # Only write the soft-delete columns (and the auto_now timestamp, if any)
+        update_fields = ["deleted_at", "is_active"]
+        if hasattr(self, "modified_at"):
+            update_fields.append("modified_at")
+        return update_fields
 
     class Meta:
         abstract = True
@@ -10,6 +10,14 @@ NOT_IMPLEMENTED_ERROR_MESSAGE = "You must define a `model` on the inheriting Rep
 
 class BaseRepository:
     model: Optional[Type[models.Model]] = None
+    _soft_delete: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Resolve the soft-delete check once per repository rather than per query
+        cls._soft_delete = cls.model is not None and issubclass(
+            cls.model, SoftDeleteTimestampMixin
+        )
 
     @classmethod
     def get(cls, *, pk: Any) -> Optional[models.Model]:
@@ -29,7 +37,7 @@ class BaseRepository:
             if cls.model is None:
                 raise NotImplementedError(NOT_IMPLEMENTED_ERROR_MESSAGE)
 
-            if issubclass(cls.model, SoftDeleteTimestampMixin):
+            if cls._soft_delete:
                 return cls.model.objects.filter(is_active=True)
 
             return cls.model.objects.all()
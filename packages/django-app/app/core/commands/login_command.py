@@ -6,6 +6,7 @@ from common.commands.abstract_base_command import AbstractBaseCommand
 
 from ..forms import LoginForm
 from ..models.user import User
+from ..repositories.user_repository import UserRepository
 
 
 class LoginResult(NamedTuple):
@@ -23,9 +24,8 @@ class LoginCommand(AbstractBaseCommand):
         user = self.form.cleaned_data["user"]
         timezone = self.form.cleaned_data.get("timezone")
 
-        if timezone:
-            user.timezone = timezone
-            user.save(update_fields=["timezone"])
+        if timezone and timezone != user.timezone:
+            UserRepository.update_timezone(user, timezone)
 
         token, created = Token.objects.get_or_create(user=user)
 
@@ -1,5 +1,7 @@
 from typing import NamedTuple
 
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from rest_framework.authtoken.models import Token
 
 from common.commands.abstract_base_command import AbstractBaseCommand
@@ -24,7 +26,12 @@ class RegisterCommand(AbstractBaseCommand):
         email = self.form.cleaned_data["email"]
         password = self.form.cleaned_data["password"]
 
-        user = UserRepository.create_user(email=email, password=password)
-        token, created = Token.objects.get_or_create(user=user)
+        # Rely on the unique email constraint instead of a racy pre-check
+        try:
+            with transaction.atomic():
+                user = UserRepository.create_user(email=email, password=password)
+                token = Token.objects.create(user=user)
+        except IntegrityError:
+            raise ValidationError({"email": ["User with this email already exists"]})
 
         return RegisterResult(user=user, token=token.key)
@@ -1,4 +1,5 @@
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from django import forms
 from django.contrib.auth import authenticate
 from django.core.exceptions import ValidationError
@@ -30,12 +31,6 @@ class RegisterForm(BaseForm):
     email = forms.EmailField(required=True)
     password = forms.CharField(required=True)
 
-    def clean_email(self):
-        email = self.cleaned_data.get("email")
-        if UserRepository.email_exists(email):
-            raise ValidationError("User with this email already exists")
-        return email
-
 
 class UpdateTimezoneForm(BaseForm):
     user = forms.ModelChoiceField(queryset=UserRepository.get_queryset())
@@ -44,8 +39,8 @@ class UpdateTimezoneForm(BaseForm):
     def clean_timezone(self):
         timezone = self.cleaned_data.get("timezone")
         try:
-            pytz.timezone(timezone)
-        except pytz.UnknownTimeZoneError:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
             pass
         return timezone
 
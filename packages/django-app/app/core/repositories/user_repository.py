@@ -25,11 +25,6 @@ class UserRepository(BaseRepository):
         except User.DoesNotExist:
             return None
 
-    @classmethod
-    def email_exists(cls, email: str) -> bool:
-        """Check if user with email exists"""
-        return cls.get_queryset().filter(email=email).exists()
-
     @classmethod
     def create(cls, data: Dict[str, Any]) -> User:
         user = cls.model.objects.create(**data)
@@ -56,14 +51,14 @@ class UserRepository(BaseRepository):
 
     @classmethod
     def update_timezone(cls, user: User, timezone: str) -> User:
-        """Update user's timezone"""
+        """Update user's timezone with a single UPDATE (no save() or signals)"""
+        cls.model.objects.filter(pk=user.pk).update(timezone=timezone)
         user.timezone = timezone
-        user.save(update_fields=["timezone"])
         return user
 
     @classmethod
     def update_theme(cls, user: User, theme: str) -> User:
-        """Update user's theme preference"""
+        """Update user's theme preference with a single UPDATE (no save() or signals)"""
+        cls.model.objects.filter(pk=user.pk).update(theme=theme)
         user.theme = theme
-        user.save(update_fields=["theme"])
         return user
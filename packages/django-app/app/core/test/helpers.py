@@ -1,12 +1,22 @@
+from functools import lru_cache
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from factory import Faker
-from factory.django import DjangoModelFactory
+from factory.django import DjangoModelFactory, Password
 
 User = get_user_model()
 
 
+@lru_cache
+def _make_password(raw_password):
+    """Hash each distinct test password once; every factory user reuses it"""
+    return make_password(raw_password)
+
+
 class UserFactory(DjangoModelFactory):
     email = Faker("email")
+    password = Password("password", transform=_make_password)
     is_active = True
 
     class Meta:
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
@@ -10,13 +12,11 @@ from core.test.helpers import UserFactory
 class UserAPITestCase(TestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.user = UserFactory(email="test@example.com")
-        cls.user.set_password("testpass123")
-        cls.user.save()
+        cls.user = UserFactory(email="test@example.com", password="testpass123")
+        cls.token = Token.objects.create(user=cls.user)
 
     def setUp(self):
         self.client = APIClient()
-        self.token = Token.objects.create(user=self.user)
 
     def test_register_success(self):
         """Test successful user registration"""
@@ -77,6 +77,21 @@ class UserAPITestCase(TestCase):
         self.user.refresh_from_db()
         self.assertEqual(self.user.timezone, "America/New_York")
 
+    def test_login_with_unchanged_timezone_skips_update(self):
+        """Test login does not rewrite a timezone that is already set"""
+        data = {
+            "email": "test@example.com",
+            "password": "testpass123",
+            "timezone": self.user.timezone,
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post("/api/auth/login/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any(query["sql"].startswith("UPDATE") for query in queries.captured_queries)
+        )
+
     def test_login_invalid_credentials(self):
         """Test login with invalid credentials"""
         data = {"email": "test@example.com", "password": "wrongpassword"}
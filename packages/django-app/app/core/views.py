@@ -99,8 +99,13 @@ def register(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     except ValidationError as e:
+        errors = (
+            e.message_dict
+            if hasattr(e, "error_dict")
+            else {"non_field_errors": [str(e)]}
+        )
         return Response(
-            {"success": False, "errors": {"non_field_errors": [str(e)]}},
+            {"success": False, "errors": errors},
             status=status.HTTP_400_BAD_REQUEST,
         )
     except Exception as e:
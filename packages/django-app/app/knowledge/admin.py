@@ -19,6 +19,7 @@ class PageAdmin(admin.ModelAdmin):
     search_fields = ("title", "user__email", "slug")
     readonly_fields = ("id", "uuid", "created_at", "modified_at")
     raw_id_fields = ("user",)
+    list_select_related = ("user",)
     prepopulated_fields = {"slug": ("title",)}
     ordering = ("title",)
 
@@ -46,6 +47,7 @@ class BlockAdmin(admin.ModelAdmin):
     search_fields = ("content", "user__email", "page__title")
     readonly_fields = ("id", "uuid", "created_at", "modified_at")
     raw_id_fields = ("user", "parent", "page")
+    list_select_related = ("user", "page__user", "parent")
     ordering = ("page", "order")
 
     fieldsets = (
@@ -84,6 +86,10 @@ class BlockAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        # get_tagged_pages renders each row's tag pages; fetch them in one query
+        return super().get_queryset(request).prefetch_related("pages")
+
     def content_preview(self, obj):
         if obj.content:
             return obj.content[:100] + "..." if len(obj.content) > 100 else obj.content
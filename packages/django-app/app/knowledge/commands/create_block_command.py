@@ -1,3 +1,5 @@
+from django.db import transaction
+
 from common.commands.abstract_base_command import AbstractBaseCommand
 
 from ..forms.create_block_form import CreateBlockForm
@@ -20,7 +22,7 @@ class CreateBlockCommand(AbstractBaseCommand):
         page = self.form.cleaned_data["page"]
         content = self.form.cleaned_data.get("content", "")
         content_type = self.form.cleaned_data.get("content_type", "text")
-        block_type = self.form.cleaned_data.get("block_type", "bullet")
+        block_type = self.form.cleaned_data.get("block_type", Block.BULLET)
         order = self.form.cleaned_data.get("order", 0)
         parent = None
         if "parent" in self.form.cleaned_data:
@@ -32,65 +34,51 @@ class CreateBlockCommand(AbstractBaseCommand):
         # Auto-detect block type from content if not explicitly set
         final_block_type = self._detect_block_type_from_content(content, block_type)
 
-        # Create the block
-        block = Block.objects.create(
-            user=user,
-            page=page,
-            parent=parent,
-            content=content,
-            content_type=content_type,
-            block_type=final_block_type,
-            order=order,
-            media_url=media_url,
-            media_metadata=media_metadata,
-            properties=properties,
-        )
-
-        # Extract and set tags from content (business logic)
-        if block.content:
-            sync_tags_form = SyncBlockTagsForm(
-                {
-                    "block": block.uuid,
-                    "content": block.content,
-                    "user": user.id,
-                }
+        # Extract properties from content (business logic) before the INSERT,
+        # rather than writing them back with a second UPDATE
+        if content:
+            properties = Block.parse_content_properties(content)
+
+        # Insert the block and its tags in one transaction
+        with transaction.atomic():
+            # Create the block
+            block = Block.objects.create(
+                user=user,
+                page=page,
+                parent=parent,
+                content=content,
+                content_type=content_type,
+                block_type=final_block_type,
+                order=order,
+                media_url=media_url,
+                media_metadata=media_metadata,
+                properties=properties,
             )
-            if sync_tags_form.is_valid():
-                sync_command = SyncBlockTagsCommand(sync_tags_form)
-                sync_command.execute()
-                # Refresh block from database to get updated tag relationships
-                block.refresh_from_db()
 
-        # Extract and set properties from content (business logic)
-        if block.content:
-            block.extract_properties_from_content()
+            # Extract and set tags from content (business logic)
+            if block.content:
+                sync_tags_form = SyncBlockTagsForm(
+                    {
+                        "block": block,
+                        "content": block.content,
+                        "user": user,
+                    }
+                )
+                if sync_tags_form.is_valid():
+                    sync_command = SyncBlockTagsCommand(sync_tags_form)
+                    sync_command.execute()
 
         return block
 
     def _detect_block_type_from_content(self, content: str, block_type: str) -> str:
         """Auto-detect block type from content patterns"""
         # If block_type was explicitly provided and isn't default, use it
-        if block_type != "bullet":
+        if block_type != Block.BULLET:
             return block_type
 
         # Only auto-detect if we have content
         if not content:
             return block_type
 
-        content_stripped = content.strip()
-        content_lower = content_stripped.lower()
-
-        # Check for TODO patterns
-        if content_lower.startswith("todo"):
-            return "todo"
-        elif content_lower.startswith("[ ]"):
-            return "todo"
-        elif content_lower.startswith("[x]"):
-            return "done"
-        elif content_stripped.startswith("☐"):
-            return "todo"
-        elif content_stripped.startswith("☑"):
-            return "done"
-
-        # Default to original block_type
-        return block_type
+        # Check for TODO patterns, defaulting to the original block_type
+        return Block.match_type_prefix(content) or block_type
@@ -1,3 +1,5 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.utils.text import slugify
 
 from common.commands.abstract_base_command import AbstractBaseCommand
@@ -16,15 +18,22 @@ class CreatePageCommand(AbstractBaseCommand):
         """Execute the command"""
         super().execute()  # This validates the form
 
-        user = self.form.cleaned_data["user"]
-        title = self.form.cleaned_data["title"]
-
-        page = Page.objects.create(
-            user=user,
-            title=title,
-            slug=self.form.cleaned_data.get("slug") or slugify(title),
-            content=self.form.cleaned_data.get("content", ""),
-            is_published=self.form.cleaned_data.get("is_published", True),
-        )
+        cleaned_data = self.form.cleaned_data
+        user = cleaned_data["user"]
+        title = cleaned_data["title"]
+        slug = cleaned_data.get("slug") or slugify(title)
+
+        # Rely on the (user, slug) unique constraint instead of a racy pre-check
+        try:
+            with transaction.atomic():
+                page = Page.objects.create(
+                    user=user,
+                    title=title,
+                    slug=slug,
+                    content=cleaned_data.get("content", ""),
+                    is_published=cleaned_data.get("is_published", True),
+                )
+        except IntegrityError:
+            raise ValidationError(f"Page with slug '{slug}' already exists")
 
         return page
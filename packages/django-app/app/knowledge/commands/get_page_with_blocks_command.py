@@ -1,6 +1,6 @@
 from typing import List, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
@@ -38,7 +38,7 @@ class GetPageWithBlocksCommand(AbstractBaseCommand):
             # Default to today's daily note
             try:
                 if user.timezone and user.timezone != "UTC":
-                    user_tz = pytz.timezone(user.timezone)
+                    user_tz = ZoneInfo(user.timezone)
                     now_user_tz = timezone.now().astimezone(user_tz)
                     today = now_user_tz.date()
                 else:
@@ -49,10 +49,12 @@ class GetPageWithBlocksCommand(AbstractBaseCommand):
             page, created = PageRepository.get_or_create_daily_note(user, today)
 
         # Get direct blocks (blocks that belong directly to this page)
-        direct_blocks = BlockRepository.get_root_blocks(page)
+        direct_blocks = BlockRepository.prefetch_children_tree(
+            list(BlockRepository.get_root_blocks(page))
+        )
 
         # Get referenced blocks (blocks from other pages that reference this page)
         # Look for blocks that have this page in their M2M tags relationship, but don't belong to this page
-        referenced_blocks = page.tagged_blocks.exclude(page=page)
+        referenced_blocks = BlockRepository.get_referenced_blocks(page)
 
-        return page, list(direct_blocks), list(referenced_blocks)
+        return page, direct_blocks, list(referenced_blocks)
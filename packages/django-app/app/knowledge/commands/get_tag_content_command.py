@@ -5,7 +5,7 @@ from core.models import User
 
 from ..forms import GetTagContentForm
 from ..models import BlockData, PageData
-from ..repositories import PageRepository
+from ..repositories import BlockRepository, PageRepository
 
 
 class GetTagContentCommand(AbstractBaseCommand):
@@ -28,11 +28,13 @@ class GetTagContentCommand(AbstractBaseCommand):
         if not tag_page:
             return None
 
-        # Get direct blocks (blocks that belong directly to this page)
-        direct_blocks = tag_page.blocks.all().order_by("order")
+        # Get direct blocks (root blocks of this page; children are nested under them)
+        direct_blocks = BlockRepository.prefetch_children_tree(
+            list(BlockRepository.get_root_blocks(tag_page))
+        )
 
         # Get referenced blocks (blocks from other pages that reference this tag)
-        referenced_blocks = tag_page.tagged_blocks.exclude(page=tag_page)
+        referenced_blocks = BlockRepository.get_referenced_blocks(tag_page)
 
         # Get all pages that have blocks with this tag (excluding the tag page itself)
         pages = []
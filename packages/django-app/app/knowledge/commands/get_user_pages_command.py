@@ -21,15 +21,14 @@ class GetUserPagesCommand(AbstractBaseCommand):
         limit = self.form.cleaned_data.get("limit", 10)
         offset = self.form.cleaned_data.get("offset", 0)
 
-        queryset = Page.objects.filter(user=user)
+        queryset = Page.objects.filter(user=user).select_related("user")
         if published_only:
             queryset = queryset.filter(is_published=True)
 
-        pages = queryset[offset : offset + limit]
-        total_count = queryset.count()
+        # Fetch one extra row to learn whether there is a next page without a COUNT(*)
+        pages = list(queryset[offset : offset + limit + 1])
 
         return {
-            "pages": list(pages),
-            "total_count": total_count,
-            "has_more": (offset + limit) < total_count,
+            "pages": pages[:limit],
+            "has_more": len(pages) > limit,
         }
@@ -36,6 +36,5 @@ class SearchPagesCommand(AbstractBaseCommand):
 
         return PagesData(
             pages=[page.to_dict() for page in pages],
-            total_count=queryset.count(),
             has_more=False,
         )
@@ -6,6 +6,8 @@ from common.commands.abstract_base_command import AbstractBaseCommand
 from ..forms.sync_block_tags_form import SyncBlockTagsForm
 from ..models import Block, Page
 
+HASHTAG_PATTERN = re.compile(r"#([a-zA-Z0-9_-]+)")
+
 
 class SyncBlockTagsCommand(AbstractBaseCommand):
     """Command to synchronize a block's tags based on hashtags in content"""
@@ -27,8 +29,7 @@ class SyncBlockTagsCommand(AbstractBaseCommand):
             tag_pages = block.pages.filter(
                 slug__in=list(block.get_tag_names())
             ).exclude(page_type="daily")
-            for tag_page in tag_pages:
-                block.pages.remove(tag_page)
+            block.pages.remove(*tag_pages)
             return
 
         current_tag_names = set(block.get_tag_names())
@@ -41,22 +42,22 @@ class SyncBlockTagsCommand(AbstractBaseCommand):
                 slug__in=list(tags_to_remove),
                 user=user,
             ).exclude(page_type="daily")
-            for tag_page in tag_pages_to_remove:
-                block.pages.remove(tag_page)
+            block.pages.remove(*tag_pages_to_remove)
 
-        # Add new tags
+        # Add new tags in a single through-table insert
         tags_to_add = new_tag_names - current_tag_names
-        for tag_name in tags_to_add:
-            tag_page = self._get_or_create_tag_page(tag_name, user)
-            block.pages.add(tag_page)
+        if tags_to_add:
+            tag_pages_to_add = [
+                self._get_or_create_tag_page(tag_name, user) for tag_name in tags_to_add
+            ]
+            block.pages.add(*tag_pages_to_add)
 
     def _extract_hashtags(self, content: str) -> List[str]:
         """Extract hashtag names from content"""
-        if not content:
+        if not content or "#" not in content:
             return []
 
-        hashtag_pattern = r"#([a-zA-Z0-9_-]+)"
-        return re.findall(hashtag_pattern, content)
+        return HASHTAG_PATTERN.findall(content)
 
     def _get_or_create_tag_page(self, tag_name: str, user) -> Page:
         """Get or create a tag page for the given tag name"""
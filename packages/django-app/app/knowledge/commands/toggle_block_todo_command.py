@@ -5,6 +5,13 @@ from common.commands.abstract_base_command import AbstractBaseCommand
 from ..forms.toggle_block_todo_form import ToggleBlockTodoForm
 from ..models import Block
 
+TODO_PREFIX_PATTERN = re.compile(r"^\s*todo\b", re.IGNORECASE)
+# Status keywords in any case, with or without a trailing colon
+STATUS_KEYWORD_PATTERNS = {
+    keyword: re.compile(rf"\b{keyword}\b", re.IGNORECASE)
+    for keyword in ("TODO", "DONE", "LATER", "WONTDO")
+}
+
 
 class ToggleBlockTodoCommand(AbstractBaseCommand):
     """Command to toggle a block's todo status"""
@@ -19,50 +26,34 @@ class ToggleBlockTodoCommand(AbstractBaseCommand):
         block = self.form.cleaned_data["block"]
 
         # Cycle through todo states: bullet -> todo -> done -> later -> wontdo -> todo
-        if block.block_type == "todo":
-            block.block_type = "done"
+        if block.block_type == Block.TODO:
+            block.block_type = Block.DONE
             block.content = self._replace_content_prefix(block.content, "TODO", "DONE")
-        elif block.block_type == "done":
-            block.block_type = "later"
+        elif block.block_type == Block.DONE:
+            block.block_type = Block.LATER
             block.content = self._replace_content_prefix(block.content, "DONE", "LATER")
-        elif block.block_type == "later":
-            block.block_type = "wontdo"
+        elif block.block_type == Block.LATER:
+            block.block_type = Block.WONTDO
             block.content = self._replace_content_prefix(
                 block.content, "LATER", "WONTDO"
             )
-        elif block.block_type == "wontdo":
-            block.block_type = "todo"
+        elif block.block_type == Block.WONTDO:
+            block.block_type = Block.TODO
             block.content = self._replace_content_prefix(
                 block.content, "WONTDO", "TODO"
             )
         else:
-            block.block_type = "todo"
+            block.block_type = Block.TODO
             # For non-todo blocks, prepend TODO if content doesn't start with it
-            if not re.match(r"^\s*todo\b", block.content, re.IGNORECASE):
+            if not TODO_PREFIX_PATTERN.match(block.content):
                 block.content = f"TODO {block.content}".strip()
 
-        block.save()
+        block.save(update_fields=["block_type", "content", "modified_at"])
         return block
 
     def _replace_content_prefix(
         self, content: str, old_prefix: str, new_prefix: str
     ) -> str:
         """Replace old prefix with new prefix in content, preserving case and formatting"""
-        # Replace with colon (e.g., "TODO:" -> "DONE:")
-        content = re.sub(rf"\b{old_prefix}\b(?=\s*:)", new_prefix, content)
-        # Replace without colon (e.g., "TODO" -> "DONE")
-        content = re.sub(rf"\b{old_prefix}\b(?!\s*:)", new_prefix, content)
-        # Handle lowercase variants
-        content = re.sub(
-            rf"\b{old_prefix.lower()}\b(?=\s*:)",
-            new_prefix,
-            content,
-            flags=re.IGNORECASE,
-        )
-        content = re.sub(
-            rf"\b{old_prefix.lower()}\b(?!\s*:)",
-            new_prefix,
-            content,
-            flags=re.IGNORECASE,
-        )
-        return content
+        # e.g. "TODO:" -> "DONE:", "todo" -> "DONE"
+        return STATUS_KEYWORD_PATTERNS[old_prefix].sub(new_prefix, content)
@@ -1,4 +1,5 @@
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from common.commands.abstract_base_command import AbstractBaseCommand
 
@@ -7,6 +8,17 @@ from ..forms.update_block_form import UpdateBlockForm
 from ..models import Block
 from .sync_block_tags_command import SyncBlockTagsCommand
 
+AUTO_DETECTED_BLOCK_TYPES = frozenset((Block.BULLET, Block.TODO, Block.DONE))
+UPDATABLE_FIELDS = (
+    "content",
+    "content_type",
+    "block_type",
+    "order",
+    "media_url",
+    "media_metadata",
+    "properties",
+)
+
 
 class UpdateBlockCommand(AbstractBaseCommand):
     """Command to update an existing block"""
@@ -18,13 +30,14 @@ class UpdateBlockCommand(AbstractBaseCommand):
         """Execute the command"""
         super().execute()  # This validates the form
 
-        user = self.form.cleaned_data["user"]
-        block = self.form.cleaned_data["block"]
+        cleaned_data = self.form.cleaned_data
+        user = cleaned_data["user"]
+        block = cleaned_data["block"]
 
-        # Update fields
-        content_updated = False
-        if "parent" in self.form.cleaned_data:
-            parent = self.form.cleaned_data["parent"]
+        # Update fields, saving only the columns that were provided
+        update_fields = ["parent", "modified_at"]
+        if "parent" in cleaned_data:
+            parent = cleaned_data["parent"]
             # Check for circular references
             if self._would_create_circular_reference(block, parent):
                 raise ValidationError(
@@ -37,22 +50,12 @@ class UpdateBlockCommand(AbstractBaseCommand):
             block.parent = None
 
         # Update other fields
-        for field in [
-            "content",
-            "content_type",
-            "block_type",
-            "order",
-            "media_url",
-            "media_metadata",
-            "properties",
-        ]:
-            if (
-                field in self.form.cleaned_data
-                and self.form.cleaned_data[field] is not None
-            ):
-                setattr(block, field, self.form.cleaned_data[field])
-                if field == "content":
-                    content_updated = True
+        for field in UPDATABLE_FIELDS:
+            value = cleaned_data.get(field)
+            if value is not None:
+                setattr(block, field, value)
+                update_fields.append(field)
+        content_updated = "content" in update_fields
 
         # Auto-detect block type from content if content was updated
         if content_updated:
@@ -61,27 +64,34 @@ class UpdateBlockCommand(AbstractBaseCommand):
             )
             if auto_detected_type != block.block_type:
                 block.block_type = auto_detected_type
+                if "block_type" not in update_fields:
+                    update_fields.append("block_type")
 
-        block.save()
-
-        # Extract and set tags if content was updated (business logic)
-        if content_updated and block.content:
-            sync_tags_form = SyncBlockTagsForm(
-                {
-                    "block": block.uuid,
-                    "content": block.content,
-                    "user": user.id,
-                }
-            )
-            if sync_tags_form.is_valid():
-                sync_command = SyncBlockTagsCommand(sync_tags_form)
-                sync_command.execute()
-                # Refresh block from database to get updated tag relationships
-                block.refresh_from_db()
-
-        # Extract and set properties from content if content was updated (business logic)
+        # Extract properties from content if content was updated (business logic),
+        # saving them with the block rather than in a second UPDATE
         if content_updated and block.content:
-            block.extract_properties_from_content()
+            extracted_properties = Block.parse_content_properties(block.content)
+            if extracted_properties != block.properties:
+                block.properties = extracted_properties
+                if "properties" not in update_fields:
+                    update_fields.append("properties")
+
+        # Save the block and its tags in one transaction
+        with transaction.atomic():
+            block.save(update_fields=update_fields)
+
+            # Extract and set tags if content was updated (business logic)
+            if content_updated and block.content:
+                sync_tags_form = SyncBlockTagsForm(
+                    {
+                        "block": block,
+                        "content": block.content,
+                        "user": user,
+                    }
+                )
+                if sync_tags_form.is_valid():
+                    sync_command = SyncBlockTagsCommand(sync_tags_form)
+                    sync_command.execute()
 
         return block
 
@@ -92,38 +102,17 @@ class UpdateBlockCommand(AbstractBaseCommand):
         # Only auto-detect for bullet, todo, and done types
         # Don't override other explicit types like heading, code, etc.
         # Don't auto-detect for later and wontdo - these are explicit states
-        if current_block_type not in ["bullet", "todo", "done"]:
+        if current_block_type not in AUTO_DETECTED_BLOCK_TYPES:
             return current_block_type
 
         # Only auto-detect if we have content
         if not content:
             return current_block_type
 
-        content_stripped = content.strip()
-        content_lower = content_stripped.lower()
-
-        # Check for TODO patterns
-        if content_lower.startswith("todo"):
-            return "todo"
-        elif content_lower.startswith("[ ]"):
-            return "todo"
-        elif content_lower.startswith("[x]"):
-            return "done"
-        elif content_stripped.startswith("☐"):
-            return "todo"
-        elif content_stripped.startswith("☑"):
-            return "done"
-        elif content_lower.startswith("done"):
-            return "done"
-        elif content_lower.startswith("later"):
-            return "later"
-        elif content_lower.startswith("wontdo"):
-            return "wontdo"
-
-        # If none of the patterns match, return bullet for todo/done types
-        if current_block_type in ["todo", "done"]:
-            return "bullet"
-        return current_block_type
+        # Check for TODO patterns; if none match, todo/done types revert to bullet
+        return (
+            Block.match_type_prefix(content, Block.UPDATE_TYPE_PREFIXES) or Block.BULLET
+        )
 
     def _would_create_circular_reference(self, block, proposed_parent):
         """Check if setting proposed_parent as parent would create a circular reference"""
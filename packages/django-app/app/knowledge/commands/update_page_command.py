@@ -1,14 +1,17 @@
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.utils.text import slugify
 
 from common.commands.abstract_base_command import AbstractBaseCommand
+from core.models import User
 
 from ..forms.update_page_form import UpdatePageForm
 from ..forms.update_page_references_form import UpdatePageReferencesForm
 from ..models import Page
-from ..repositories import PageRepository
 from .update_page_references_command import UpdatePageReferencesCommand
 
+UPDATABLE_FIELDS = ("content", "is_published")
+
 
 class UpdatePageCommand(AbstractBaseCommand):
     """Command to update an existing page"""
@@ -20,64 +23,62 @@ class UpdatePageCommand(AbstractBaseCommand):
         """Execute the command"""
         super().execute()  # This validates the form
 
-        page = self.form.cleaned_data["page"]
+        # The rename and the reference rewrite commit together or not at all
+        with transaction.atomic():
+            cleaned_data = self.form.cleaned_data
+            page = cleaned_data["page"]
 
-        # Store old values before updating
-        old_title = page.title
-        old_slug = page.slug
+            # Store old values before updating
+            old_title = page.title
+            old_slug = page.slug
 
-        # Update fields if provided
-        title_changed = False
+            # Update fields if provided, saving only the columns that changed
+            update_fields = ["modified_at"]
+            title_changed = False
 
-        if (
-            "title" in self.form.cleaned_data
-            and self.form.cleaned_data["title"] is not None
-        ):
-            new_title = self.form.cleaned_data["title"]
-            if new_title != page.title:
+            new_title = cleaned_data.get("title")
+            if new_title is not None and new_title != page.title:
                 page.title = new_title
                 title_changed = True
 
                 # Always auto-update slug when title changes
-                new_slug = slugify(new_title)
-                if new_slug != page.slug:
-                    # Check if new slug conflicts with existing pages
-                    if PageRepository.slug_exists_for_user(
-                        slug=new_slug, user=page.user, exclude_page_uuid=str(page.uuid)
-                    ):
-                        raise ValidationError(
-                            f"Page with title '{new_title}' would create a conflicting URL"
-                        )
-
-                    page.slug = new_slug
-
-        if (
-            "content" in self.form.cleaned_data
-            and self.form.cleaned_data["content"] is not None
-        ):
-            page.content = self.form.cleaned_data["content"]
-
-        if (
-            "is_published" in self.form.cleaned_data
-            and self.form.cleaned_data["is_published"] is not None
-        ):
-            page.is_published = self.form.cleaned_data["is_published"]
-
-        page.save()
-
-        # Update references if title changed (which means slug also changed)
-        if title_changed:
-            self._update_page_references(page, old_title, old_slug)
-
-        return page
+                page.slug = slugify(new_title)
+                update_fields += ["title", "slug"]
+
+            for field in UPDATABLE_FIELDS:
+                value = cleaned_data.get(field)
+                if value is not None and value != getattr(page, field):
+                    setattr(page, field, value)
+                    update_fields.append(field)
+
+            # Rely on the (user, slug) unique constraint instead of a racy pre-check;
+            # the inner savepoint lets the IntegrityError be turned into a
+            # validation error without breaking the outer transaction
+            try:
+                with transaction.atomic():
+                    page.save(update_fields=update_fields)
+            except IntegrityError:
+                raise ValidationError(
+                    f"Page with title '{page.title}' would create a conflicting URL"
+                )
+
+            # Update references if title changed (which means slug also changed)
+            if title_changed:
+                self._update_page_references(
+                    page, cleaned_data["user"], old_title, old_slug
+                )
+
+            return page
 
     def _update_page_references(
-        self, page: Page, old_title: str, old_slug: str
+        self, page: Page, user: User, old_title: str, old_slug: str
     ) -> None:
         """Update all references to this page when title or slug changes"""
+        # Hand over the instances this request already loaded instead of
+        # re-selecting the page and user by key
         reference_form_data = {
-            "page": str(page.uuid),
-            "user": page.user.id,
+            "page": page,
+            "user": user,
         }
 
         # Only include old values that actually changed
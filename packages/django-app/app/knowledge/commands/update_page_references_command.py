@@ -49,9 +49,9 @@ class UpdatePageReferencesCommand(AbstractBaseCommand):
         for block in updated_blocks:
             sync_form = SyncBlockTagsForm(
                 data={
-                    "block": str(block.uuid),
+                    "block": block,
                     "content": block.content,
-                    "user": user.id,
+                    "user": user,
                 }
             )
             if sync_form.is_valid():
@@ -30,7 +30,7 @@ class CreateBlockForm(BaseForm):
         page = self.cleaned_data.get("page")
         user = self.cleaned_data.get("user")
 
-        if page and user and page.user != user:
+        if page and user and page.user_id != user.pk:
             raise ValidationError("Page does not belong to the specified user")
 
         return page
@@ -41,7 +41,7 @@ class CreateBlockForm(BaseForm):
         if "parent" in self.cleaned_data:
             parent = self.cleaned_data.get("parent")
 
-        if parent and user and parent.user != user:
+        if parent and user and parent.user_id != user.pk:
             raise ValidationError("Parent block does not belong to the specified user")
 
         return parent
@@ -1,5 +1,3 @@
-from typing import Optional
-
 from django import forms
 from django.core.exceptions import ValidationError
 
@@ -7,8 +5,6 @@ from common.forms.base_form import BaseForm
 from core.models import User
 from core.repositories import UserRepository
 
-from ..models import Page
-
 
 class CreatePageForm(BaseForm):
     user = forms.ModelChoiceField(queryset=UserRepository.get_queryset())
@@ -25,15 +21,6 @@ class CreatePageForm(BaseForm):
                 raise ValidationError("Title cannot be empty")
         return title
 
-    def clean_slug(self) -> Optional[str]:
-        slug = self.cleaned_data.get("slug")
-        user = self.cleaned_data.get("user")
-        if slug and user:
-            # Check if slug already exists for this user
-            if Page.objects.filter(user=user, slug=slug).exists():
-                raise ValidationError(f"Page with slug '{slug}' already exists")
-        return slug
-
     def clean_user(self) -> User:
         user = self.cleaned_data.get("user")
         if not user:
@@ -1,7 +1,7 @@
 from django import forms
 
 from common.forms.uuid_model_choice_field import UUIDModelChoiceField
-from core.models import User
+from core.repositories import UserRepository
 
 from ..models import Block
 
@@ -11,7 +11,8 @@ class SyncBlockTagsForm(forms.Form):
 
     block = UUIDModelChoiceField(queryset=Block.objects.all())
     content = forms.CharField(required=False, widget=forms.Textarea)
-    user = forms.ModelChoiceField(queryset=User.objects.all())
+    # Callers pass already-loaded instances, which these fields accept as-is
+    user = UUIDModelChoiceField(queryset=UserRepository.get_queryset())
 
     def clean(self):
         cleaned_data = super().clean()
@@ -19,7 +20,7 @@ class SyncBlockTagsForm(forms.Form):
         user = cleaned_data.get("user")
 
         # Ensure user owns the block
-        if block and user and block.user != user:
+        if block and user and block.user_id != user.pk:
             raise forms.ValidationError(
                 "User does not have permission to modify this block"
             )
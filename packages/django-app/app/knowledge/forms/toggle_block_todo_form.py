@@ -17,7 +17,7 @@ class ToggleBlockTodoForm(BaseForm):
         block = self.cleaned_data.get("block")
         user = self.cleaned_data.get("user")
 
-        if block and user and block.user != user:
+        if block and user and block.user_id != user.pk:
             raise ValidationError("Block not found")
 
         return block
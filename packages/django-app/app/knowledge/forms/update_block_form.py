@@ -27,7 +27,7 @@ class UpdateBlockForm(BaseForm):
         block = self.cleaned_data.get("block")
         user = self.cleaned_data.get("user")
 
-        if block and user and block.user != user:
+        if block and user and block.user_id != user.pk:
             raise ValidationError("Block not found")
 
         return block
@@ -38,7 +38,7 @@ class UpdateBlockForm(BaseForm):
         if "parent" in self.cleaned_data:
             parent = self.cleaned_data.get("parent")
 
-        if parent and user and parent.user != user:
+        if parent and user and parent.user_id != user.pk:
             raise ValidationError("Parent block not found")
 
         return parent
@@ -22,7 +22,7 @@ class UpdatePageForm(BaseForm):
         page = self.cleaned_data.get("page")
         user = self.cleaned_data.get("user")
 
-        if page and user and page.user != user:
+        if page and user and page.user_id != user.pk:
             raise ValidationError("Page not found")
 
         return page
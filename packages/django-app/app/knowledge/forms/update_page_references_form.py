@@ -1,7 +1,7 @@
 from django import forms
 
 from common.forms.uuid_model_choice_field import UUIDModelChoiceField
-from core.models import User
+from core.repositories import UserRepository
 
 from ..models import Page
 
@@ -12,7 +12,8 @@ class UpdatePageReferencesForm(forms.Form):
     page = UUIDModelChoiceField(queryset=Page.objects.all())
     old_title = forms.CharField(max_length=200, required=False)
     old_slug = forms.SlugField(max_length=200, required=False)
-    user = forms.ModelChoiceField(queryset=User.objects.all())
+    # Callers pass already-loaded instances, which these fields accept as-is
+    user = UUIDModelChoiceField(queryset=UserRepository.get_queryset())
 
     def clean(self):
         cleaned_data = super().clean()
@@ -22,7 +23,7 @@ class UpdatePageReferencesForm(forms.Form):
         old_slug = cleaned_data.get("old_slug")
 
         # Ensure user owns the page
-        if page and user and page.user != user:
+        if page and user and page.user_id != user.pk:
             raise forms.ValidationError(
                 "User does not have permission to modify this page"
             )
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-10-17 05:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("knowledge", "0017_alter_block_block_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="block",
+            index=models.Index(
+                fields=["user", "block_type"], name="blocks_user_id_484c90_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.2 on 2026-10-17 06:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("knowledge", "0018_block_user_block_type_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="page",
+            index=models.Index(
+                fields=["user", "title"], name="pages_user_id_4561b8_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated manually to index substring searches on block content and page titles/slugs
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("knowledge", "0019_page_user_title_index"),
+    ]
+
+    # On PostgreSQL `icontains` compiles to UPPER("col"::text) LIKE UPPER(%s), so
+    # the indexes cover that expression rather than the bare columns. They stay
+    # out of model state because the test database is built from the models
+    # without running migrations, and so never has pg_trgm installed.
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS blocks_content_upper_trgm_idx "
+                "ON blocks USING gin ((UPPER(content::text)) gin_trgm_ops);"
+            ),
+            reverse_sql=(
+                "DROP INDEX CONCURRENTLY IF EXISTS blocks_content_upper_trgm_idx;"
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS pages_title_upper_trgm_idx "
+                "ON pages USING gin ((UPPER(title::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS pages_title_upper_trgm_idx;",
+        ),
+        # Page search ORs title with slug, so both sides need an index
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS pages_slug_upper_trgm_idx "
+                "ON pages USING gin ((UPPER(slug::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS pages_slug_upper_trgm_idx;",
+        ),
+    ]
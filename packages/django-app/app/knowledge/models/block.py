@@ -1,5 +1,5 @@
 import re
-from typing import Optional, TypedDict
+from typing import List, Optional, Tuple, TypedDict
 
 from django.conf import settings
 from django.db import models
@@ -7,6 +7,11 @@ from django.db import models
 from common.models.crud_timestamps_mixin import CRUDTimestampsMixin
 from common.models.uuid_mixin import UUIDModelMixin
 
+# key:: value property patterns, compiled once for every content parse
+LINE_PROPERTY_PATTERN = re.compile(r"^([a-zA-Z0-9_-]+)::\s*(.+)$")
+INLINE_PROPERTY_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+::")
+INLINE_PROPERTY_PATTERN = re.compile(r"([a-zA-Z0-9_-]+)::\s*([^\s]+)")
+
 
 class Block(UUIDModelMixin, CRUDTimestampsMixin):
     """
@@ -14,6 +19,29 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
     They can be nested hierarchically and have various types and properties.
     """
 
+    # Block types the commands branch on; shared so the literals can't drift
+    BULLET = "bullet"
+    TODO = "todo"
+    DONE = "done"
+    LATER = "later"
+    WONTDO = "wontdo"
+
+    # Content prefixes (lowercase) that imply a block type, checked in order
+    TYPE_PREFIXES = (
+        ("todo", TODO),
+        ("[ ]", TODO),
+        ("[x]", DONE),
+        ("☐", TODO),
+        ("☑", DONE),
+    )
+    # Editing a block also recognises the remaining status keywords
+    UPDATE_TYPE_PREFIXES = TYPE_PREFIXES + (
+        ("done", DONE),
+        ("later", LATER),
+        ("wontdo", WONTDO),
+    )
+    TYPE_PREFIX_LENGTH = max(len(prefix) for prefix, _ in UPDATE_TYPE_PREFIXES)
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="blocks"
     )
@@ -62,17 +90,17 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
     block_type = models.CharField(
         max_length=20,
         choices=[
-            ("bullet", "Bullet Point"),
-            ("todo", "Todo"),
-            ("done", "Done"),
-            ("later", "Later"),
-            ("wontdo", "Won't Do"),
+            (BULLET, "Bullet Point"),
+            (TODO, "Todo"),
+            (DONE, "Done"),
+            (LATER, "Later"),
+            (WONTDO, "Won't Do"),
             ("heading", "Heading"),
             ("quote", "Quote"),
             ("code", "Code Block"),
             ("divider", "Divider"),
         ],
-        default="bullet",
+        default=BULLET,
     )
 
     order = models.PositiveIntegerField(default=0, help_text="Order within parent/page")
@@ -89,6 +117,7 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
             models.Index(fields=["page", "order"]),
             models.Index(fields=["content_type"]),
             models.Index(fields=["block_type"]),
+            models.Index(fields=["user", "block_type"]),
         ]
 
     def __str__(self):
@@ -102,8 +131,13 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
         else:
             return f"Block {self.uuid}: [empty]"
 
+    def _is_prefetched(self, relation):
+        return relation in getattr(self, "_prefetched_objects_cache", {})
+
     def get_children(self):
         """Get direct children blocks"""
+        if self._is_prefetched("children"):
+            return self.children.all()
         return self.children.all().order_by("order")
 
     def get_descendants(self):
@@ -128,12 +162,43 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
         if not self.content:
             return {}
 
+        extracted_properties = self.parse_content_properties(self.content)
+
+        # Sync with properties field
+        if extracted_properties != self.properties:
+            self.properties = extracted_properties
+            self.save(update_fields=["properties"])
+
+        return extracted_properties
+
+    @staticmethod
+    def match_type_prefix(
+        content: str, prefixes: Tuple[Tuple[str, str], ...] = TYPE_PREFIXES
+    ) -> Optional[str]:
+        """Return the block type implied by the start of the content, if any"""
+        # Only the leading characters can match, so lowercase just those
+        content_head = content.lstrip()[: Block.TYPE_PREFIX_LENGTH].lower()
+        for prefix, block_type in prefixes:
+            if content_head.startswith(prefix):
+                return block_type
+        return None
+
+    @staticmethod
+    def parse_content_properties(content):
+        """Parse key:: value properties from content without touching the database"""
+        # Most blocks have no properties; skip the regex passes entirely for them
+        if "::" not in content:
+            return {}
+        return Block._parse_properties(content)
+
+    @staticmethod
+    def _parse_properties(content):
+        """Parse key:: value properties out of block content"""
         extracted_properties = {}
 
         # First: Handle line-start properties (can have multi-word values)
-        line_pattern = r"^([a-zA-Z0-9_-]+)::\s*(.+)$"
-        for line in self.content.split("\n"):
-            match = re.match(line_pattern, line.strip())
+        for line in content.split("\n"):
+            match = LINE_PROPERTY_PATTERN.match(line.strip())
             if match:
                 key, value = match.groups()
                 # For line-start properties, strip out any inline properties from the value
@@ -141,27 +206,21 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
                 value_words = value.split()
                 clean_value_words = []
                 for word in value_words:
-                    if "::" in word and re.match(r"^[a-zA-Z0-9_-]+::", word):
+                    if "::" in word and INLINE_PROPERTY_KEY_PATTERN.match(word):
                         break  # Stop at first inline property
                     clean_value_words.append(word)
                 if clean_value_words:
                     extracted_properties[key] = " ".join(clean_value_words)
 
         # Second: Handle inline properties (single word values)
-        inline_pattern = r"([a-zA-Z0-9_-]+)::\s*([^\s]+)"
-        for line in self.content.split("\n"):
+        for line in content.split("\n"):
             # Find all inline properties in each line
-            matches = re.findall(inline_pattern, line)
+            matches = INLINE_PROPERTY_PATTERN.findall(line)
             for key, value in matches:
                 # Only add if not already found as line-start property
                 if key not in extracted_properties:
                     extracted_properties[key] = value.strip()
 
-        # Sync with properties field
-        if extracted_properties != self.properties:
-            self.properties = extracted_properties
-            self.save(update_fields=["properties"])
-
         return extracted_properties
 
     def get_property(self, key, default=None):
@@ -192,13 +251,28 @@ class Block(UUIDModelMixin, CRUDTimestampsMixin):
             }
         return None
 
-    def get_tags(self):
-        """Get all pages this block is tagged with (excludes the page it belongs to and daily notes)"""
-        return self.pages.exclude(uuid=self.page.uuid).exclude(page_type="daily")
-
-    def get_tag_names(self):
+    def _get_tag_pages_queryset(self):
+        return self.pages.exclude(pk=self.page_id).exclude(page_type="daily")
+
+    def get_tags(self) -> List:
+        """
+        Get all pages this block is tagged with (excludes the page it belongs to and
+        daily notes). Always returns a list, filtered in Python when pages are
+        prefetched and fetched with one query otherwise.
+        """
+        if self._is_prefetched("pages"):
+            return [
+                page
+                for page in self.pages.all()
+                if page.pk != self.page_id and page.page_type != "daily"
+            ]
+        return list(self._get_tag_pages_queryset())
+
+    def get_tag_names(self) -> List[str]:
         """Get tag names (uses slug format without # prefix)"""
-        return [page.slug for page in self.get_tags()]
+        if self._is_prefetched("pages"):
+            return [tag.slug for tag in self.get_tags()]
+        return list(self._get_tag_pages_queryset().values_list("slug", flat=True))
 
     def to_dict(self, include_page_context: bool = False) -> "BlockData":
         """Convert block to dictionary with proper typing"""
@@ -41,6 +41,7 @@ class Page(UUIDModelMixin, CRUDTimestampsMixin):
         ordering = ("title",)
         indexes = [
             models.Index(fields=["user", "page_type", "date"]),
+            models.Index(fields=["user", "title"]),
         ]
 
     def __str__(self):
@@ -97,7 +98,6 @@ class PageData(TypedDict):
 
 class PagesData(TypedDict):
     pages: List[PageData]
-    total_count: int
     has_more: bool
 
 
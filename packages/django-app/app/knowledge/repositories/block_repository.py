@@ -2,7 +2,7 @@ from datetime import date
 from typing import Any, Dict, List, Optional
 
 from django.db import transaction
-from django.db.models import Max, QuerySet
+from django.db.models import Max, Prefetch, QuerySet, prefetch_related_objects
 
 from common.repositories.base_repository import BaseRepository
 
@@ -24,10 +24,20 @@ class BlockRepository(BaseRepository):
         except cls.model.DoesNotExist:
             return None
 
+    @classmethod
+    def get_serializable_queryset(cls) -> QuerySet:
+        """Blocks with the relations Block.to_dict() reads loaded up front"""
+        return cls.get_queryset().select_related("user", "page", "parent")
+
+    @classmethod
+    def get_tag_pages_prefetch(cls) -> Prefetch:
+        """Prefetch of tag pages limited to the columns Block.get_tags() reads"""
+        return Prefetch("pages", queryset=Page.objects.only("id", "slug", "page_type"))
+
     @classmethod
     def get_page_blocks(cls, page: Page, include_children: bool = True) -> QuerySet:
         """Get blocks for a page"""
-        queryset = cls.get_queryset().filter(page=page)
+        queryset = cls.get_serializable_queryset().filter(page=page)
 
         if not include_children:
             queryset = queryset.filter(parent=None)
@@ -37,13 +47,39 @@ class BlockRepository(BaseRepository):
     @classmethod
     def get_root_blocks(cls, page: Page) -> QuerySet:
         """Get top-level blocks (no parent) for a page"""
-        return cls.get_queryset().filter(page=page, parent=None).order_by("order")
+        return (
+            cls.get_serializable_queryset()
+            .filter(page=page, parent=None)
+            .order_by("order")
+        )
 
     @classmethod
     def get_child_blocks(cls, parent_block: Block) -> QuerySet:
         """Get direct children of a block"""
         return cls.get_queryset().filter(parent=parent_block).order_by("order")
 
+    @classmethod
+    def get_referenced_blocks(cls, page: Page) -> QuerySet:
+        """Get blocks from other pages that are tagged with this page"""
+        return (
+            cls.get_serializable_queryset()
+            .filter(pages=page)
+            .exclude(page=page)
+            .prefetch_related(cls.get_tag_pages_prefetch())
+        )
+
+    @classmethod
+    def prefetch_children_tree(cls, blocks: List[Block]) -> List[Block]:
+        """Prefetch nested children and their tags, two queries per depth level"""
+        children = Prefetch(
+            "children", queryset=cls.get_serializable_queryset().order_by("order")
+        )
+        level = list(blocks)
+        while level:
+            prefetch_related_objects(level, cls.get_tag_pages_prefetch(), children)
+            level = [child for block in level for child in block.children.all()]
+        return blocks
+
     @classmethod
     def get_block_descendants(cls, block: Block) -> List[Block]:
         """Get all descendant blocks recursively"""
@@ -64,12 +100,12 @@ class BlockRepository(BaseRepository):
     @classmethod
     def get_todo_blocks(cls, user) -> QuerySet:
         """Get all todo blocks for user"""
-        return cls.get_blocks_by_type(user, "todo")
+        return cls.get_blocks_by_type(user, Block.TODO)
 
     @classmethod
     def get_done_blocks(cls, user) -> QuerySet:
         """Get all done blocks for user"""
-        return cls.get_blocks_by_type(user, "done")
+        return cls.get_blocks_by_type(user, Block.DONE)
 
     @classmethod
     def search_by_content(cls, user, query: str) -> QuerySet:
@@ -149,11 +185,19 @@ class BlockRepository(BaseRepository):
             blocks_order_data: List of dicts with 'uuid' and 'order' keys
         """
         try:
+            blocks_by_uuid = {
+                str(block.uuid): block
+                for block in cls.get_queryset().filter(
+                    uuid__in=[item["uuid"] for item in blocks_order_data]
+                )
+            }
+            blocks = []
             for item in blocks_order_data:
-                block = cls.get_by_uuid(item["uuid"])
+                block = blocks_by_uuid.get(str(item["uuid"]))
                 if block:
                     block.order = item["order"]
-                    block.save(update_fields=["order"])
+                    blocks.append(block)
+            cls.model.objects.bulk_update(blocks, ["order"])
             return True
         except Exception:
             return False
@@ -181,7 +225,7 @@ class BlockRepository(BaseRepository):
             cls.get_queryset()
             .filter(
                 user=user,
-                block_type="todo",
+                block_type=Block.TODO,
                 page__page_type="daily",
                 page__date__lt=today,
             )
@@ -202,11 +246,12 @@ class BlockRepository(BaseRepository):
                 max_order = queryset.aggregate(max_order=Max("order"))["max_order"]
                 max_order = max_order if max_order is not None else 0
 
-                # Update each block's page and order
+                # Update each block's page and order, then write them in one batch
+                blocks = list(blocks)
                 for i, block in enumerate(blocks, start=1):
                     block.page = target_page
                     block.order = max_order + i
-                    block.save(update_fields=["page", "order"])
+                cls.model.objects.bulk_update(blocks, ["page", "order"])
 
                 return True
         except Exception:
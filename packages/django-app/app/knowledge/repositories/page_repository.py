@@ -1,11 +1,11 @@
 from datetime import date
 from typing import Any, Dict, Optional
 
-from django.db.models import Count, QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 
 from common.repositories.base_repository import BaseRepository
 
-from ..models import Page
+from ..models import Block, Page
 
 
 class PageRepository(BaseRepository):
@@ -40,18 +40,17 @@ class PageRepository(BaseRepository):
         cls, user, published_only: bool = True, limit: int = 10, offset: int = 0
     ) -> Dict[str, Any]:
         """Get paginated user pages with filtering"""
-        queryset = cls.get_queryset().filter(user=user)
+        queryset = cls.get_queryset().filter(user=user).select_related("user")
 
         if published_only:
             queryset = queryset.filter(is_published=True)
 
-        total_count = queryset.count()
-        pages = list(queryset[offset : offset + limit])
+        # Fetch one extra row to learn whether there is a next page without a COUNT(*)
+        pages = list(queryset[offset : offset + limit + 1])
 
         return {
-            "pages": pages,
-            "total_count": total_count,
-            "has_more": (offset + limit) < total_count,
+            "pages": pages[:limit],
+            "has_more": len(pages) > limit,
         }
 
     @classmethod
@@ -135,12 +134,12 @@ class PageRepository(BaseRepository):
     def get_recent_pages_with_blocks(cls, user, limit=7) -> QuerySet:
         """Get the most recent daily pages that have blocks, ordered by creation date (not modification date)"""
 
-        # Get pages that have blocks, ordered by their actual date (creation date)
+        # Get pages that have blocks, ordered by their actual date (creation date).
+        # EXISTS stops at the first block instead of counting (and grouping) them all.
         pages_with_blocks = (
             cls.get_queryset()
             .filter(user=user)
-            .annotate(block_count=Count("blocks"))
-            .filter(block_count__gt=0)
+            .filter(Exists(Block.objects.filter(page=OuterRef("pk"))))
             .order_by("-date")[
                 :limit
             ]  # Order by date field (creation date), not modified_at
@@ -161,15 +160,3 @@ class PageRepository(BaseRepository):
     def get_all_tag_pages(cls, user) -> QuerySet:
         """Get all tag pages for a user"""
         return cls.get_queryset().filter(user=user, page_type="tag").order_by("title")
-
-    @classmethod
-    def slug_exists_for_user(
-        cls, slug: str, user, exclude_page_uuid: str = None
-    ) -> bool:
-        """Check if a slug already exists for a user, optionally excluding a specific page"""
-        queryset = cls.get_queryset().filter(user=user, slug=slug)
-
-        if exclude_page_uuid:
-            queryset = queryset.exclude(uuid=exclude_page_uuid)
-
-        return queryset.exists()
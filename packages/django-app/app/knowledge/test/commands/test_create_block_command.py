@@ -203,3 +203,18 @@ class TestCreateBlockCommand(TestCase):
 
         # Verify that SyncBlockTagsCommand was not called for empty content
         mock_sync_command_class.assert_not_called()
+
+    def test_should_store_properties_from_content_on_create(self):
+        """Test that key:: value properties are saved with the new block"""
+        form_data = {
+            "user": self.user.id,
+            "page": self.page.uuid,
+            "content": "status:: active\npriority:: high",
+        }
+        form = CreateBlockForm(form_data)
+        form.is_valid()
+        command = CreateBlockCommand(form)
+        block = command.execute()
+
+        block.refresh_from_db()
+        self.assertEqual(block.properties, {"status": "active", "priority": "high"})
@@ -0,0 +1,49 @@
+from django.test import TestCase
+
+from knowledge.commands import GetTagContentCommand
+from knowledge.forms import GetTagContentForm
+
+from ..helpers import BlockFactory, PageFactory, UserFactory
+
+
+class TestGetTagContentCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.tag_page = PageFactory(
+            user=cls.user, title="#project", slug="project", page_type="tag"
+        )
+        cls.root_block = BlockFactory(
+            user=cls.user, page=cls.tag_page, content="Root", order=0
+        )
+        cls.child_block = BlockFactory(
+            user=cls.user,
+            page=cls.tag_page,
+            parent=cls.root_block,
+            content="Child",
+            order=0,
+        )
+
+    def _execute(self):
+        form = GetTagContentForm({"user": self.user.id, "tag_name": "project"})
+        form.is_valid()
+        return GetTagContentCommand(form).execute()
+
+    def test_should_return_only_root_blocks_as_direct_blocks(self):
+        """Test that nested blocks come back under their parent, not at the top level"""
+        result = self._execute()
+
+        self.assertEqual(result["direct_blocks"], [self.root_block])
+        with self.assertNumQueries(0):
+            children = result["direct_blocks"][0].to_dict_with_children()["children"]
+        self.assertEqual(
+            [child["uuid"] for child in children], [str(self.child_block.uuid)]
+        )
+
+    def test_get_tags_should_return_list_without_prefetch(self):
+        """Test that Block.get_tags returns a list whether or not pages are prefetched"""
+        tag_page = PageFactory(user=self.user, title="other", slug="other")
+        self.child_block.pages.add(tag_page)
+
+        self.assertEqual(self.child_block.get_tags(), [tag_page])
+        self.assertEqual(self.child_block.get_tag_names(), ["other"])
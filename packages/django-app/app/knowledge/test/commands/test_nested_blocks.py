@@ -179,13 +179,8 @@ class TestNestedBlocks(TestCase):
         update_command = UpdateBlockCommand(form)
         updated_child = update_command.execute()
 
-        # Refresh from database
-        child.refresh_from_db()
-        parent1.refresh_from_db()
-        parent2.refresh_from_db()
-
-        # Verify updated state
-        self.assertEqual(child.parent, parent2)
+        # Verify updated state (get_children() always queries, no refresh needed)
+        self.assertEqual(updated_child.parent, parent2)
         self.assertEqual(len(parent1.get_children()), 0)
         self.assertEqual(len(parent2.get_children()), 1)
 
@@ -229,13 +224,9 @@ class TestNestedBlocks(TestCase):
         update_command = UpdateBlockCommand(form)
         updated_child = update_command.execute()
 
-        # Refresh from database
-        child.refresh_from_db()
-        parent.refresh_from_db()
-
-        # Verify updated state
-        self.assertIsNone(child.parent)
-        self.assertEqual(child.get_depth(), 0)
+        # Verify updated state (get_children() always queries, no refresh needed)
+        self.assertIsNone(updated_child.parent)
+        self.assertEqual(updated_child.get_depth(), 0)
         self.assertEqual(len(parent.get_children()), 0)
 
     def test_should_preserve_order_within_parent(self):
@@ -5,6 +5,7 @@ from django.test import TestCase
 
 from knowledge.commands import CreateBlockCommand, UpdateBlockCommand
 from knowledge.forms import CreateBlockForm, UpdateBlockForm
+from knowledge.models import Block
 
 from ..helpers import BlockFactory, PageFactory, UserFactory
 
@@ -202,6 +203,26 @@ class TestUpdateBlockCommand(TestCase):
         self.assertEqual(updated_block.block_type, "bullet")
         self.assertEqual(updated_block.order, 5)
 
+    def test_should_only_save_provided_fields(self):
+        """Test that an update leaves columns it was not given untouched"""
+        form_data = {
+            "user": self.user.id,
+            "block": str(self.block.uuid),
+            "order": 7,
+        }
+        form = UpdateBlockForm(form_data)
+        form.is_valid()
+
+        # Simulate a concurrent edit to a column this update doesn't touch
+        Block.objects.filter(pk=self.block.pk).update(content="Edited elsewhere")
+
+        command = UpdateBlockCommand(form)
+        command.execute()
+
+        self.block.refresh_from_db()
+        self.assertEqual(self.block.order, 7)
+        self.assertEqual(self.block.content, "Edited elsewhere")
+
     def test_should_handle_empty_content_update(self):
         """Test that updating to empty content preserves block type"""
         form_data = {
@@ -291,3 +312,18 @@ class TestUpdateBlockCommand(TestCase):
 
         # Verify that SyncBlockTagsCommand was not called when content wasn't updated
         mock_sync_command_class.assert_not_called()
+
+    def test_should_store_properties_from_content_on_update(self):
+        """Test that key:: value properties are saved when content is updated"""
+        form_data = {
+            "user": self.user.id,
+            "block": str(self.block.uuid),
+            "content": "Ship it due:: friday",
+        }
+        form = UpdateBlockForm(form_data)
+        form.is_valid()
+        command = UpdateBlockCommand(form)
+        command.execute()
+
+        self.block.refresh_from_db()
+        self.assertEqual(self.block.properties, {"due": "friday"})
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from knowledge.commands import UpdatePageCommand
+from knowledge.forms import UpdatePageForm
+from knowledge.models import Page
+
+from ..helpers import BlockFactory, PageFactory, UserFactory
+
+
+class TestUpdatePageCommand(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.page = PageFactory(user=cls.user, title="Original", slug="original")
+        cls.block = BlockFactory(
+            user=cls.user, page=PageFactory(user=cls.user), content="See #original"
+        )
+
+    def test_should_rewrite_references_when_title_changes(self):
+        """Test that renaming a page updates hashtags pointing at it"""
+        form = UpdatePageForm(
+            {"user": self.user.id, "page": str(self.page.uuid), "title": "Renamed"}
+        )
+        form.is_valid()
+        UpdatePageCommand(form).execute()
+
+        self.block.refresh_from_db()
+        self.assertEqual(self.block.content, "See #renamed")
+
+    def test_should_roll_back_rename_when_reference_update_fails(self):
+        """Test that a failed reference rewrite leaves the page unrenamed"""
+        form = UpdatePageForm(
+            {"user": self.user.id, "page": str(self.page.uuid), "title": "Renamed"}
+        )
+        form.is_valid()
+
+        with patch(
+            "knowledge.commands.update_page_command.UpdatePageReferencesCommand"
+        ) as mock_reference_command_class:
+            mock_reference_command_class.return_value.execute.side_effect = (
+                RuntimeError("reference update failed")
+            )
+            with self.assertRaises(RuntimeError):
+                UpdatePageCommand(form).execute()
+
+        page = Page.objects.get(pk=self.page.pk)
+        self.assertEqual(page.title, "Original")
+        self.assertEqual(page.slug, "original")
@@ -103,8 +103,7 @@ class TestNestedBlocksIntegration(TestCase):
         form = UpdateBlockForm(form_data)
         form.is_valid()
         update_cmd = UpdateBlockCommand(form)
-        update_cmd.execute()
-        child2.refresh_from_db()
+        child2 = update_cmd.execute()
 
         # Verify indentation
         self.assertEqual(child2.get_depth(), 2)
@@ -120,8 +119,7 @@ class TestNestedBlocksIntegration(TestCase):
         form = UpdateBlockForm(form_data)
         form.is_valid()
         update_cmd = UpdateBlockCommand(form)
-        update_cmd.execute()
-        grandchild.refresh_from_db()
+        grandchild = update_cmd.execute()
 
         # Verify outdentation
         self.assertEqual(grandchild.get_depth(), 0)
@@ -2,6 +2,7 @@ from django.test import TestCase
 
 from knowledge.commands.toggle_block_todo_command import ToggleBlockTodoCommand
 from knowledge.forms import ToggleBlockTodoForm
+from knowledge.models import Block
 from knowledge.test.helpers import BlockFactory, PageFactory, UserFactory
 
 
@@ -52,16 +53,21 @@ class TestTodoContentIntegration(TestCase):
             ("Todo mixed case", "DONE mixed case"),
         ]
 
-        for original_content, expected_done_content in test_cases:
-            with self.subTest(content=original_content):
-                # Create block with original content
-                block = BlockFactory(
+        # Create all blocks up front in a single INSERT
+        blocks = Block.objects.bulk_create(
+            [
+                BlockFactory.build(
                     user=self.user,
                     page=self.page,
                     content=original_content,
                     block_type="todo",
                 )
+                for original_content, _ in test_cases
+            ]
+        )
 
+        for block, (original_content, expected_done_content) in zip(blocks, test_cases):
+            with self.subTest(content=original_content):
                 # Toggle to done
                 form_data = {"user": self.user.id, "block": str(block.uuid)}
                 form = ToggleBlockTodoForm(form_data)
@@ -82,16 +88,23 @@ class TestTodoContentIntegration(TestCase):
             ("Done mixed case", "LATER mixed case"),
         ]
 
-        for original_content, expected_later_content in test_cases:
-            with self.subTest(content=original_content):
-                # Create block with original content
-                block = BlockFactory(
+        # Create all blocks up front in a single INSERT
+        blocks = Block.objects.bulk_create(
+            [
+                BlockFactory.build(
                     user=self.user,
                     page=self.page,
                     content=original_content,
                     block_type="done",
                 )
+                for original_content, _ in test_cases
+            ]
+        )
 
+        for block, (original_content, expected_later_content) in zip(
+            blocks, test_cases
+        ):
+            with self.subTest(content=original_content):
                 # Toggle to later (next state after done)
                 form_data = {"user": self.user.id, "block": str(block.uuid)}
                 form = ToggleBlockTodoForm(form_data)
@@ -132,12 +145,18 @@ class TestTodoContentIntegration(TestCase):
             "TODO: Research @mentions functionality",
         ]
 
-        for content in test_cases:
-            with self.subTest(content=content):
-                block = BlockFactory(
+        # Create all blocks up front in a single INSERT
+        blocks = Block.objects.bulk_create(
+            [
+                BlockFactory.build(
                     user=self.user, page=self.page, content=content, block_type="todo"
                 )
+                for content in test_cases
+            ]
+        )
 
+        for block, content in zip(blocks, test_cases):
+            with self.subTest(content=content):
                 form_data = {"user": self.user.id, "block": str(block.uuid)}
                 form = ToggleBlockTodoForm(form_data)
                 form.is_valid()
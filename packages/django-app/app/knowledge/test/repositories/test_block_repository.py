@@ -0,0 +1,89 @@
+from django.test import TestCase
+
+from knowledge.repositories import BlockRepository
+
+from ..helpers import BlockFactory, PageFactory, UserFactory
+
+
+class TestBlockRepository(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.page = PageFactory(user=cls.user)
+
+    def _create_block(self, parent=None, order=0):
+        return BlockFactory(user=self.user, page=self.page, parent=parent, order=order)
+
+    def test_should_prefetch_children_tree_with_one_query_per_level(self):
+        root_one = self._create_block(order=0)
+        root_two = self._create_block(order=1)
+        child_two = self._create_block(parent=root_one, order=1)
+        child_one = self._create_block(parent=root_one, order=0)
+        grandchild = self._create_block(parent=child_one)
+        self._create_block(parent=root_two)
+
+        roots = list(BlockRepository.get_root_blocks(self.page))
+
+        # children and tag pages for each depth level with blocks in it
+        with self.assertNumQueries(6):
+            BlockRepository.prefetch_children_tree(roots)
+
+        with self.assertNumQueries(0):
+            children = list(roots[0].get_children())
+            self.assertEqual(children, [child_one, child_two])
+            grandchildren = list(children[0].get_children())
+            self.assertEqual(grandchildren, [grandchild])
+            self.assertEqual(list(grandchildren[0].get_children()), [])
+            self.assertEqual(len(roots[1].get_children()), 1)
+            for root in roots:
+                root.to_dict_with_children()
+
+    def test_should_serialize_referenced_blocks_without_extra_queries(self):
+        tag_page = PageFactory(user=self.user)
+        other_tag = PageFactory(user=self.user)
+        for order in range(3):
+            block = self._create_block(order=order)
+            block.pages.add(tag_page, other_tag)
+
+        with self.assertNumQueries(2):
+            blocks = list(BlockRepository.get_referenced_blocks(tag_page))
+            data = [block.to_dict(include_page_context=True) for block in blocks]
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(
+            sorted(tag["name"] for tag in data[0]["tags"]),
+            sorted([tag_page.slug, other_tag.slug]),
+        )
+
+    def test_should_prefetch_nothing_for_empty_blocks(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(BlockRepository.prefetch_children_tree([]), [])
+
+    def test_should_reorder_blocks_in_one_update(self):
+        first = self._create_block(order=0)
+        second = self._create_block(order=1)
+
+        # one SELECT for the blocks and one batched UPDATE
+        with self.assertNumQueries(2):
+            result = BlockRepository.reorder_blocks(
+                [
+                    {"uuid": str(first.uuid), "order": 1},
+                    {"uuid": str(second.uuid), "order": 0},
+                ]
+            )
+
+        self.assertTrue(result)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.order, second.order), (1, 0))
+
+    def test_should_move_blocks_to_end_of_target_page(self):
+        target_page = PageFactory(user=self.user)
+        BlockFactory(user=self.user, page=target_page, order=5)
+        blocks = [self._create_block(order=0), self._create_block(order=1)]
+
+        self.assertTrue(BlockRepository.move_blocks_to_page(blocks, target_page))
+
+        moved = BlockRepository.get_page_blocks(target_page).filter(order__gt=5)
+        self.assertEqual([block.pk for block in moved], [block.pk for block in blocks])
+        self.assertEqual([block.order for block in moved], [6, 7])
@@ -6,7 +6,7 @@ from django.test import TestCase
 from knowledge.models import Page
 from knowledge.repositories import PageRepository
 
-from ..helpers import PageFactory, UserFactory
+from ..helpers import BlockFactory, PageFactory, UserFactory
 
 
 class TestPageRepository(TestCase):
@@ -68,18 +68,28 @@ class TestPageRepository(TestCase):
 
     def test_should_get_user_pages_with_pagination(self):
         # Create test pages
-        PageFactory.create_batch(5, user=self.user, is_published=True)
+        Page.objects.bulk_create(
+            PageFactory.build_batch(5, user=self.user, is_published=True)
+        )
 
         result = PageRepository.get_user_pages(self.user, limit=3, offset=0)
 
         self.assertEqual(len(result["pages"]), 3)
-        self.assertEqual(result["total_count"], 5)
         self.assertTrue(result["has_more"])
 
+        result = PageRepository.get_user_pages(self.user, limit=3, offset=2)
+
+        self.assertEqual(len(result["pages"]), 3)
+        self.assertFalse(result["has_more"])
+
     def test_should_filter_published_pages_only(self):
         # Create published and unpublished pages
-        published_page = PageFactory(user=self.user, is_published=True)
-        PageFactory(user=self.user, is_published=False)
+        Page.objects.bulk_create(
+            [
+                PageFactory.build(user=self.user, is_published=True),
+                PageFactory.build(user=self.user, is_published=False),
+            ]
+        )
 
         result = PageRepository.get_user_pages(self.user, published_only=True)
 
@@ -88,8 +98,12 @@ class TestPageRepository(TestCase):
 
     def test_should_get_all_pages_when_published_only_false(self):
         # Create published and unpublished pages
-        PageFactory(user=self.user, is_published=True)
-        PageFactory(user=self.user, is_published=False)
+        Page.objects.bulk_create(
+            [
+                PageFactory.build(user=self.user, is_published=True),
+                PageFactory.build(user=self.user, is_published=False),
+            ]
+        )
 
         result = PageRepository.get_user_pages(self.user, published_only=False)
 
@@ -121,8 +135,12 @@ class TestPageRepository(TestCase):
         self.assertEqual(page.title, today.strftime("%Y-%m-%d"))
 
     def test_should_search_pages_by_title(self):
-        PageFactory(user=self.user, title="Django Tutorial")
-        PageFactory(user=self.user, title="Python Guide")
+        Page.objects.bulk_create(
+            [
+                PageFactory.build(user=self.user, title="Django Tutorial"),
+                PageFactory.build(user=self.user, title="Python Guide"),
+            ]
+        )
 
         results = PageRepository.search_by_title(self.user, "Django")
 
@@ -156,8 +174,12 @@ class TestPageRepository(TestCase):
         self.assertTrue(Page.objects.filter(uuid=page.uuid).exists())
 
     def test_should_get_published_pages(self):
-        PageFactory(user=self.user, is_published=True)
-        PageFactory(user=self.user, is_published=False)
+        Page.objects.bulk_create(
+            [
+                PageFactory.build(user=self.user, is_published=True),
+                PageFactory.build(user=self.user, is_published=False),
+            ]
+        )
 
         published_pages = PageRepository.get_published_pages(self.user)
 
@@ -165,10 +187,23 @@ class TestPageRepository(TestCase):
         self.assertTrue(published_pages.first().is_published)
 
     def test_should_get_unpublished_pages(self):
-        PageFactory(user=self.user, is_published=True)
-        PageFactory(user=self.user, is_published=False)
+        Page.objects.bulk_create(
+            [
+                PageFactory.build(user=self.user, is_published=True),
+                PageFactory.build(user=self.user, is_published=False),
+            ]
+        )
 
         unpublished_pages = PageRepository.get_unpublished_pages(self.user)
 
         self.assertEqual(unpublished_pages.count(), 1)
         self.assertFalse(unpublished_pages.first().is_published)
+
+    def test_should_get_recent_pages_with_blocks_only(self):
+        page_with_blocks = PageFactory(user=self.user, date=date(2025, 1, 2))
+        BlockFactory.create_batch(2, user=self.user, page=page_with_blocks)
+        PageFactory(user=self.user, date=date(2025, 1, 3))
+
+        pages = PageRepository.get_recent_pages_with_blocks(self.user)
+
+        self.assertEqual(list(pages), [page_with_blocks])
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
@@ -12,13 +12,11 @@ class BasicKnowledgeAPITestCase(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.user = UserFactory(email="test@example.com")
-        cls.user.set_password("testpass123")
-        cls.user.save()
+        cls.user = UserFactory(email="test@example.com", password="testpass123")
+        cls.token = Token.objects.create(user=cls.user)
 
     def setUp(self):
         self.client = APIClient()
-        self.token = Token.objects.create(user=self.user)
         self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
 
     def test_create_page_api_success(self):
@@ -45,6 +43,47 @@ class BasicKnowledgeAPITestCase(TestCase):
         self.assertFalse(response.data["success"])
         self.assertIn("errors", response.data)
 
+    def test_create_page_api_duplicate_slug(self):
+        """Test creating a page whose slug already exists returns a validation error"""
+        data = {"title": "Duplicate Page"}
+        self.client.post("/knowledge/api/pages/", data, format="json")
+
+        response = self.client.post("/knowledge/api/pages/", data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data["success"])
+        self.assertIn("already exists", response.data["errors"]["non_field_errors"][0])
+        self.assertEqual(
+            Page.objects.filter(slug="duplicate-page", user=self.user).count(), 1
+        )
+
+    def test_update_page_api_conflicting_slug(self):
+        """Test renaming a page onto another page's slug returns a validation error"""
+        self.client.post("/knowledge/api/pages/", {"title": "Taken"}, format="json")
+        create_response = self.client.post(
+            "/knowledge/api/pages/", {"title": "Original"}, format="json"
+        )
+        page_uuid = create_response.data["data"]["uuid"]
+
+        update_data = {"page": page_uuid, "title": "Taken"}
+        response = self.client.put(
+            "/knowledge/api/pages/update/", update_data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("conflicting URL", response.data["errors"]["non_field_errors"][0])
+        self.assertEqual(Page.objects.get(uuid=page_uuid).slug, "original")
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=1024)
+    def test_create_page_api_rejects_oversized_body(self):
+        """Test oversized JSON bodies are rejected before reaching the view"""
+        data = {"title": "Big Page", "content": "x" * 2048}
+        response = self.client.post("/knowledge/api/pages/", data, format="json")
+
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(response.json()["success"])
+        self.assertFalse(Page.objects.filter(title="Big Page").exists())
+
     def test_create_page_api_authentication_required(self):
         """Test API authentication - replaces manual auth tests in commands"""
         self.client.credentials()  # Remove authentication
@@ -312,7 +312,6 @@ def get_pages(request):
 
             pages_data: PagesData = {
                 "pages": [page.to_dict() for page in result["pages"]],
-                "total_count": result["total_count"],
                 "has_more": result["has_more"],
             }
 
@@ -668,7 +667,6 @@ def search_pages(request):
 
             search_data: PagesData = {
                 "pages": result["pages"],
-                "total_count": len(result["pages"]),
                 "has_more": False,  # Since we're limiting results, we don't need pagination for search
             }
 